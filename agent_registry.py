@@ -0,0 +1,37 @@
+import importlib
+import threading
+
+
+# Language name -> (module, class); modules are only imported when first needed
+AGENTS = {
+    "Python": ("python_tutorial", "PythonTutorialAgent"),
+    "C#": ("csharp_tutorial", "CsharpTutorialAgent"),
+    "C++": ("cpp_tutorial", "CppTutorialAgent"),
+}
+
+
+def available_languages():
+    return list(AGENTS.keys())
+
+
+def get_agent_class(language):
+    try:
+        module_name, class_name = AGENTS[language]
+    except KeyError:
+        raise ValueError(f"No tutorial agent registered for {language!r}") from None
+
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+def create_agent(language, learner=None):
+    return get_agent_class(language)(learner)
+
+
+def prefetch_agent(language):
+    """Import the agent module for ``language`` on a background thread."""
+    if language not in AGENTS:
+        return None
+    thread = threading.Thread(target=get_agent_class, args=(language,), daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,514 @@
+import collections
+import functools
+import itertools
+import re
+import threading
+
+import numpy as np
+
+from keyword_matcher import KeywordMatcher, strip_parenthetical
+from knowledge_store import KnowledgeBase, knowledge_path, read_only, shared_resource
+from nltk_resources import nltk_resources
+from progress_store import progress_store
+from subtopic_index import SubtopicIndex
+from subtopic_renderer import SubtopicRenderer
+from tutorial_index import (PASSAGES_PER_DIMENSION, SEMANTIC_DIMENSIONS, SemanticIndex, TfidfIndex,
+                            corpus_fingerprint, index_path_for, knowledge_base_passages)
+
+
+EXIT_COMMANDS = ("exit", "quit", "stop", "bye", "goodbye")
+
+# "semantic" answers free-text questions from dense LSA vectors instead of TF-IDF
+RETRIEVAL_MODES = ("tfidf", "semantic")
+
+# Words that ask for a listing or report rather than naming a topic
+INTENT_KEYWORDS = {
+    "progress": "show_progress",
+    "topic": "list_topics",
+    "topics": "list_topics",
+    "subtopic": "list_topics",
+    "subtopics": "list_topics",
+}
+
+# Intents found by the keyword matcher, in the order they take precedence
+INTENT_PRIORITY = ("show_progress", "list_topics")
+
+# Whole-message commands, looked up directly
+TOPIC_COMMANDS = {"start": "next_subtopic_chunks", "next": "next_subtopic_chunks",
+                  "previous": "previous_subtopic_chunks", "back": "previous_subtopic_chunks", "quiz": "start_quiz"}
+MENU_CHOICES = {"1": "start_quiz", "2": "choose_new_topic", "3": "show_progress"}
+
+TOPIC_NUMBER_PATTERN = re.compile(r"\d+")
+
+# Distinct lowercased messages whose preprocessed form is remembered
+PREPROCESS_CACHE_SIZE = 4096
+
+# Queries preprocessed and scored together by most_similar_subtopics
+BATCH_CHUNK_SIZE = 1024
+
+# Subtopics offered when asking for clarification
+CLARIFY_SUGGESTIONS = 3
+
+
+def _preprocess(text):
+    tokens = nltk_resources.tokenize(text)
+    stop_words = nltk_resources.stop_words
+    return " ".join(
+        [nltk_resources.lemmatize(word) for word in tokens if word not in stop_words and word.isalnum()])
+
+
+_cached_preprocess = functools.lru_cache(maxsize=PREPROCESS_CACHE_SIZE)(_preprocess)
+
+
+def preprocess_text(text):
+    """Normalise a learner message for retrieval, remembering recent messages."""
+    return _cached_preprocess(text.lower())
+
+
+def preprocess_passage(text):
+    """Normalise knowledge-base text or one-off queries without filling the message cache."""
+    return _preprocess(text.lower())
+
+
+_route_counts = collections.Counter()
+_route_lock = threading.Lock()
+
+
+def cache_stats():
+    """Hit/miss counters of the preprocessing caches, for sizing them."""
+    return {
+        "preprocess": _cached_preprocess.cache_info()._asdict(),
+        "lemma": nltk_resources.lemma_cache_info()._asdict(),
+    }
+
+
+def join_chunks(response):
+    """Turn a response that may be split into chunks back into one string."""
+    return response if isinstance(response, str) else "\n\n".join(response)
+
+
+def route_stats():
+    """How many messages each routing stage has answered; ``similar_subtopic`` is the TF-IDF fallback."""
+    with _route_lock:
+        return dict(_route_counts)
+
+
+class TutorialContent:
+    """
+    Everything a language contributes to a tutorial: its name, greeting,
+    topic outline, quiz bank and knowledge base.  The tutorial engine itself
+    lives in ``BaseTutorialAgent``.  ``aliases`` maps a topic or subtopic to
+    the other names it goes by, whether used by learners, the outline or the
+    knowledge base.
+    """
+
+    def __init__(self, language, module_file, knowledge_base, topics, quiz_questions, greeting, aliases=None,
+                 code_language=None):
+        self.language = language
+        self.code_language = code_language or language.lower()
+        self.greeting = greeting
+        self.topics = read_only(topics)
+        self.quiz_questions = read_only(quiz_questions)
+        self.aliases = read_only(aliases or {})
+        self.knowledge_base_path = knowledge_path(knowledge_base)
+        self.index_path = index_path_for(module_file)
+        self.semantic_index_path = index_path_for(module_file, "semantic")
+
+    def shared_knowledge_base(self):
+        """The process-wide ``KnowledgeBase`` of this tutorial."""
+        return shared_resource(("knowledge_base", self.knowledge_base_path),
+                               lambda: KnowledgeBase(self.knowledge_base_path))
+
+    def shared_subtopic_index(self):
+        """The process-wide ``SubtopicIndex`` between this tutorial's outline and knowledge base."""
+        return shared_resource(("subtopics", self.index_path),
+                               lambda: SubtopicIndex(self.topics, self.shared_knowledge_base(), self.aliases))
+
+
+class BaseTutorialAgent:
+    """
+    Tutorial engine shared by every language.
+
+    Subclasses only set ``content`` to a ``TutorialContent``.  The knowledge
+    base and retrieval index are built once per process and shared by all
+    instances, so an agent only carries the state of one learner's session.
+    """
+
+    content = None
+    retrieval_mode = "tfidf"
+    # Similarity below which a question gets a clarifying reply; None uses the retriever's calibrated threshold
+    min_similarity = None
+    # "plain" for the Tk window, "markdown" for web clients
+    render_theme = "plain"
+
+    # Routing stages for handle_input, tried in order; the first to return a response answers
+    routes = ("exit", "quiz_answer", "menu_choice", "intent", "topic_number", "topic_command",
+              "topic_name", "subtopic_name", "similar_subtopic")
+
+    def __init__(self, learner=None):
+        # Static content is shared by every instance; only session state lives on the agent
+        self.language = self.content.language
+        self.topics = self.content.topics
+        self.exit_commands = EXIT_COMMANDS
+        self.quiz_bank = self.content.quiz_questions
+        self.knowledge_base = shared_resource(("knowledge_base", self.content.knowledge_base_path),
+                                              self.init_knowledge_base)
+        self.index = shared_resource(("index", self.content.index_path), self.load_index)
+        self.keywords = shared_resource(("keywords", self.content.index_path), self.build_keyword_matcher)
+        self.subtopic_index = self.content.shared_subtopic_index()
+        self.renderer = shared_resource(("renderer", self.content.index_path),
+                                        lambda: SubtopicRenderer(self.knowledge_base, self.content.code_language))
+
+        self.current_topic = None
+        self.current_subtopic = None
+        self.mode = "tutorial"  # Can be "tutorial" or "quiz"
+        # Progress is kept for a named learner; anonymous sessions only track it in memory
+        self.learner = learner
+        self._progress = None
+        self.quiz_questions = []
+        self.current_question = 0
+        self.showing_menu = False
+
+    @property
+    def progress(self):
+        """``{topic: {subtopic: completed}}``, loaded from the progress store the first time it is needed."""
+        if self._progress is None:
+            progress = {topic: {subtopic: False for subtopic in subtopics}
+                        for topic, subtopics in self.topics.items()}
+            if self.learner is not None:
+                try:
+                    completed = progress_store().completed(self.learner, self.language)
+                except Exception as e:
+                    print(f"Error in loading progress: {e}")
+                    completed = ()
+                for topic, subtopic in completed:
+                    # Entries the outline no longer has are ignored
+                    if subtopic in progress.get(topic, ()):
+                        progress[topic][subtopic] = True
+            self._progress = progress
+        return self._progress
+
+    def mark_completed(self, topic, subtopic):
+        if self.progress[topic][subtopic]:
+            return
+        self.progress[topic][subtopic] = True
+        if self.learner is not None:
+            try:
+                progress_store().record(self.learner, self.language, topic, subtopic)
+            except Exception as e:
+                print(f"Error in saving progress: {e}")
+
+    def init_knowledge_base(self):
+        return KnowledgeBase(self.content.knowledge_base_path)
+
+    def load_index(self):
+        fingerprint = corpus_fingerprint(self.knowledge_base.fingerprint, nltk_resources.signature())
+        passages = knowledge_base_passages(self.knowledge_base.scan())
+        # Passages are preprocessed once, so they bypass the message cache
+        return TfidfIndex.load_or_build(self.content.index_path, fingerprint, passages, preprocess_passage)
+
+    def load_semantic_index(self):
+        fingerprint = corpus_fingerprint(self.index.fingerprint, SEMANTIC_DIMENSIONS, PASSAGES_PER_DIMENSION)
+        return SemanticIndex.load_or_build(self.content.semantic_index_path, fingerprint, self.index)
+
+    @property
+    def retriever(self):
+        """The index that answers free-text questions, chosen by ``retrieval_mode``."""
+        if self.retrieval_mode == "tfidf":
+            return self.index
+        if self.retrieval_mode == "semantic":
+            # Built on first use, so TF-IDF-only deployments never pay for it
+            return shared_resource(("semantic_index", self.content.semantic_index_path), self.load_semantic_index)
+        raise ValueError(f"Unknown retrieval mode {self.retrieval_mode!r}; use one of {RETRIEVAL_MODES}")
+
+    def build_keyword_matcher(self):
+        matcher = KeywordMatcher()
+        for phrase, intent in INTENT_KEYWORDS.items():
+            matcher.add(phrase, "intent", intent)
+        for command in self.exit_commands:
+            matcher.add(command, "intent", "exit")
+        for topic in self.topics:
+            matcher.add(topic, "topic", topic)
+            for alias in self.content.aliases.get(topic, ()):
+                matcher.add(alias, "topic", topic)
+        for topic, subtopic in self.index.labels:
+            matcher.add(subtopic, "subtopic", (topic, subtopic))
+            # "lists (List<T>)" can also be asked for as "lists"
+            matcher.add(strip_parenthetical(subtopic), "subtopic", (topic, subtopic))
+            for alias in self.content.aliases.get(subtopic, ()):
+                matcher.add(alias, "subtopic", (topic, subtopic))
+        return matcher
+
+    def preprocess_text(self, text):
+        return preprocess_text(text)
+
+    def is_exit_command(self, user_input):
+        # Whole words only, so "stopwatch" or "unstoppable" do not end the session
+        return "exit" in self.keywords.match(user_input).get("intent", ())
+
+    def get_most_similar_subtopic(self, query):
+        """Return the ``(topic, subtopic)`` knowledge-base entry that best matches ``query``."""
+        preprocessed_query = self.preprocess_text(query)
+        return self.retriever.best_match(preprocessed_query)
+
+    def get_similar_subtopics(self, query, k=CLARIFY_SUGGESTIONS):
+        """Return up to ``k`` ``((topic, subtopic), similarity)`` pairs for ``query``, best first."""
+        return self.retriever.best_matches(self.preprocess_text(query), k)
+
+    def most_similar_subtopics(self, queries, k=1, chunk_size=BATCH_CHUNK_SIZE):
+        """
+        Score many queries at once, for offline analysis of logged questions.
+
+        ``queries`` may be any iterable; it is read ``chunk_size`` queries at a
+        time and each chunk is scored with one sparse product.  Returns
+        ``(indices, scores)`` arrays of shape ``(queries, k)``, best match
+        first, where ``self.index.labels[i]`` is the ``(topic, subtopic)`` of
+        index ``i``.
+        """
+        queries = iter(queries)
+        all_indices, all_scores = [], []
+        while True:
+            chunk = list(itertools.islice(queries, chunk_size))
+            if not chunk:
+                break
+            # Logged questions are mostly one-offs, so they skip the message cache
+            indices, scores = self.retriever.top_k([preprocess_passage(query) for query in chunk], k)
+            all_indices.append(indices)
+            all_scores.append(scores)
+
+        if not all_indices:
+            k = min(k, len(self.index.labels))
+            return np.empty((0, k), dtype=np.intp), np.empty((0, k))
+        return np.concatenate(all_indices), np.concatenate(all_scores)
+
+    def greet(self):
+        return self.content.greeting
+
+    def start_tutorial(self):
+        print(f"Welcome to the {self.language} Tutorial!")
+        return self.greet()
+
+    def list_topics(self):
+        topics_list = f"\nAvailable {self.language} Topics:\n"
+        for i, topic in enumerate(self.topics.keys(), 1):
+            topics_list += f"{i}. {topic.capitalize()}\n"
+        topics_list += "\nWhich topic would you like to explore? (Type the topic name or number)"
+        return topics_list
+
+    def select_topic(self, topic):
+        self.current_topic = topic
+        self.current_subtopic = None
+        return f"Great! Let's learn about {topic}. We'll cover: {', '.join(self.topics[topic])}.\nType 'start' when you're ready to begin, or ask me anything about {topic}."
+
+    def handle_input(self, user_input):
+        return self.respond(user_input)[0]
+
+    def respond(self, user_input):
+        """Answer a message and return ``(response, is_exit)``, so callers need not look for exit commands again."""
+        chunks, is_exit = self.respond_chunks(user_input)
+        return join_chunks(chunks), is_exit
+
+    def respond_chunks(self, user_input):
+        """
+        Like ``respond``, but the response is an iterator of chunks: a long
+        subtopic comes as its introduction and description, then each
+        example, then each list such as best practices.  Joining the chunks
+        with blank lines gives the ``respond`` text.
+        """
+        user_input = user_input.lower().strip()
+        # Intents, topic names and subtopic names mentioned in the message, found in one pass
+        keywords = self.keywords.match(user_input)
+
+        for route in self.routes:
+            response = getattr(self, "route_" + route)(user_input, keywords)
+            if response is not None:
+                with _route_lock:
+                    _route_counts[route] += 1
+                return iter((response,) if isinstance(response, str) else response), route == "exit"
+
+    def route_exit(self, user_input, keywords):
+        if "exit" in keywords.get("intent", ()):
+            return f"Thank you for using the {self.language} Tutorial Agent. Goodbye!"
+
+    def route_quiz_answer(self, user_input, keywords):
+        if self.mode == "quiz":
+            return self.handle_quiz_answer(user_input)
+
+    def route_menu_choice(self, user_input, keywords):
+        # Post-tutorial menu choices
+        if self.showing_menu and user_input in MENU_CHOICES:
+            return getattr(self, MENU_CHOICES[user_input])()
+
+    def route_intent(self, user_input, keywords):
+        intents = keywords.get("intent", ())
+        for intent in INTENT_PRIORITY:
+            if intent in intents:
+                return getattr(self, intent)()
+
+    def route_topic_number(self, user_input, keywords):
+        # Topic selection by number unless a menu is showing
+        if not self.showing_menu and TOPIC_NUMBER_PATTERN.fullmatch(user_input):
+            topic_number = int(user_input)
+            topic_list = list(self.topics.keys())
+            if 1 <= topic_number <= len(topic_list):
+                return self.select_topic(topic_list[topic_number - 1])
+            return f"Please enter a number between 1 and {len(topic_list)}."
+
+    def route_topic_command(self, user_input, keywords):
+        if self.current_topic and user_input in TOPIC_COMMANDS:
+            return getattr(self, TOPIC_COMMANDS[user_input])()
+
+    def route_topic_name(self, user_input, keywords):
+        if "topic" in keywords:
+            return self.select_topic(keywords["topic"][0])
+
+    def route_subtopic_name(self, user_input, keywords):
+        # A subtopic named outright needs no similarity search; prefer one from the current topic
+        matching_subtopics = keywords.get("subtopic")
+        if matching_subtopics:
+            topic, subtopic = next(
+                (match for match in matching_subtopics
+                 if self.current_topic and self.subtopic_index.same_topic(match[0], self.current_topic)),
+                matching_subtopics[0])
+            return self.describe_subtopic(topic, subtopic)
+
+    def route_similar_subtopic(self, user_input, keywords):
+        matches = self.get_similar_subtopics(user_input)
+        (topic, subtopic), similarity = matches[0]
+        min_similarity = self.min_similarity if self.min_similarity is not None else self.retriever.min_similarity
+        if similarity < min_similarity:
+            return self.ask_for_clarification([self.subtopic_index.display_name(subtopic, topic)
+                                               for (topic, subtopic), similarity in matches if similarity > 0])
+        return self.describe_subtopic(topic, subtopic)
+
+    def ask_for_clarification(self, suggestions):
+        if not suggestions:
+            return ("I'm not sure what you'd like to learn about. "
+                    "Try asking in other words, or type 'topics' to see everything I can teach.")
+        if len(suggestions) == 1:
+            return (f"I'm not sure what you'd like to learn about. Did you mean {suggestions[0]}? "
+                    "Type its name, or 'topics' to see everything I can teach.")
+        return (f"I'm not sure what you'd like to learn about. Did you mean {', '.join(suggestions[:-1])} "
+                f"or {suggestions[-1]}? Type one of them, or 'topics' to see everything I can teach.")
+
+    def describe_subtopic(self, topic, subtopic):
+        name = self.subtopic_index.display_name(subtopic, topic)
+        return (f"Based on your question, I think you might be interested in {name}. Here's what I know:",
+                *self.subtopic_info_chunks(subtopic, topic),
+                "Do you want to know more about this, or shall we move to the next topic? Type 'next' to continue or ask me anything else.")
+
+    def choose_new_topic(self):
+        self.showing_menu = False
+        self.current_topic = None
+        self.current_subtopic = None
+        return "Sure, let's choose a new topic.\n" + self.list_topics()
+
+    def next_subtopic(self):
+        return join_chunks(self.next_subtopic_chunks())
+
+    def next_subtopic_chunks(self):
+        if not self.current_topic:
+            return "Please choose a topic first. " + self.list_topics()
+
+        current_topics = self.topics[self.current_topic]
+        if not self.current_subtopic:
+            return self.show_subtopic(current_topics[0])
+
+        next_subtopic = self.subtopic_index.neighbour(self.current_topic, self.current_subtopic, 1)
+        if next_subtopic is None and self.subtopic_index.position(self.current_topic, self.current_subtopic) is None:
+            next_subtopic = current_topics[0]
+        if next_subtopic is None:
+            self.current_subtopic = None
+            self.showing_menu = True
+            return ("We've covered all subtopics in this area. Great job!\n"
+                    "Would you like to:\n"
+                    "1. Take a quiz on this topic\n"
+                    "2. Choose a new topic to learn about\n"
+                    "3. See your overall progress\n"
+                    "Type the number of your choice or ask me anything!")
+        return self.show_subtopic(next_subtopic)
+
+    def previous_subtopic(self):
+        return join_chunks(self.previous_subtopic_chunks())
+
+    def previous_subtopic_chunks(self):
+        if not self.current_topic:
+            return "Please choose a topic first. " + self.list_topics()
+
+        previous_subtopic = None
+        if self.current_subtopic:
+            previous_subtopic = self.subtopic_index.neighbour(self.current_topic, self.current_subtopic, -1)
+        if previous_subtopic is None:
+            return f"There is nothing before this in {self.current_topic}. Type 'next' to continue."
+        return self.show_subtopic(previous_subtopic)
+
+    def show_subtopic(self, subtopic):
+        self.current_subtopic = subtopic
+        # Mark current subtopic as completed
+        self.mark_completed(self.current_topic, subtopic)
+        subtopic_info = self.render_subtopic_chunks(subtopic, self.current_topic)
+        if subtopic_info:
+            return (f"Let's learn about {subtopic}:",
+                    *subtopic_info,
+                    f"What would you like to know more about {subtopic}, or type 'next' to continue?")
+        return f"Information about {subtopic} is not available at the moment. Type 'next' to continue."
+
+    def render_subtopic_chunks(self, subtopic, topic=None):
+        """The subtopic's record formatted for display as chunks, or ``None`` if there is none."""
+        location = self.subtopic_index.locate(subtopic, topic)
+        if location is None:
+            return None
+        return self.renderer.render_chunks(location, self.render_theme)
+
+    def get_subtopic_info(self, subtopic, topic=None):
+        return join_chunks(self.subtopic_info_chunks(subtopic, topic))
+
+    def subtopic_info_chunks(self, subtopic, topic=None):
+        try:
+            subtopic_info = self.render_subtopic_chunks(subtopic, topic)
+            if subtopic_info is None:
+                return ("Information not available for this subtopic.",)
+            return subtopic_info
+        except Exception as e:
+            print(f"Error in get_subtopic_info: {e}")
+            return ("Information not available at the moment.",)
+
+    def start_quiz(self):
+        self.showing_menu = False
+        self.mode = "quiz"
+        self.current_question = 0
+        self.quiz_questions = self.get_quiz_questions()
+        if not self.quiz_questions:
+            self.mode = "tutorial"
+            return "Sorry, there are no quiz questions available for this topic."
+        return self.get_next_question()
+
+    def get_quiz_questions(self):
+        return self.quiz_bank.get(self.current_topic, ())
+
+    def get_next_question(self):
+        if self.current_question < len(self.quiz_questions):
+            question, _ = self.quiz_questions[self.current_question]
+            return f"Quiz Question {self.current_question + 1}: {question}"
+        self.mode = "tutorial"
+        return "Quiz completed! Well done! Type 'next' to continue with the tutorial or choose a new topic."
+
+    def handle_quiz_answer(self, user_answer):
+        _, correct_answer = self.quiz_questions[self.current_question]
+        if user_answer.lower() == correct_answer.lower():
+            response = "Correct!"
+        else:
+            response = f"Sorry, the correct answer is: {correct_answer}"
+
+        self.current_question += 1
+        next_question = self.get_next_question()
+        return f"{response}\n\n{next_question}"
+
+    def show_progress(self):
+        progress_report = "Here's your learning progress:\n"
+        for topic, subtopics in self.progress.items():
+            completed = sum(subtopics.values())
+            total = len(subtopics)
+            percentage = (completed / total) * 100
+            progress_report += f"{topic.capitalize()}: {completed}/{total} subtopics completed ({percentage:.0f}%)\n"
+        return progress_report
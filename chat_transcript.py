@@ -0,0 +1,84 @@
+import json
+import tempfile
+from collections import deque
+
+
+DEFAULT_WINDOW = 200
+
+
+class ChatTranscript:
+    """
+    Chat history with a bounded in-memory window.
+
+    Only the newest ``window`` messages are kept for display.  Older messages
+    are paged out to a temporary file and can be brought back a page at a
+    time when the user scrolls up, so a long session costs the chat widget
+    the same as a short one.  Once older messages are restored nothing is
+    paged out until ``trim`` is called, so new messages don't take away what
+    the user is reading.
+    """
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self.visible = deque()
+        # Messages brought back by load_older since the last trim
+        self.restored = 0
+        self._spill = None
+        self._spill_offsets = []
+
+    def __len__(self):
+        return len(self.visible) + len(self._spill_offsets)
+
+    def has_older(self):
+        return bool(self._spill_offsets)
+
+    def append(self, message):
+        """Add a message and return the older messages that no longer fit in the window."""
+        self.visible.append(message)
+        return self._evict()
+
+    def trim(self):
+        """Page restored messages back out, once the user is back at the newest ones, and return them."""
+        self.restored = 0
+        return self._evict()
+
+    def load_older(self, count):
+        """Bring back up to ``count`` paged-out messages, oldest first, and return them."""
+        if not self._spill_offsets:
+            return []
+
+        offsets = self._spill_offsets[-count:]
+        del self._spill_offsets[-count:]
+        self._spill.seek(offsets[0])
+        restored = [json.loads(line) for line in self._spill.read().splitlines()]
+        self._spill.seek(offsets[0])
+        self._spill.truncate()
+
+        self.visible.extendleft(reversed(restored))
+        self.restored += len(restored)
+        return restored
+
+    def clear(self):
+        self.visible.clear()
+        self.restored = 0
+        self._spill_offsets = []
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _evict(self):
+        evicted = []
+        while not self.restored and len(self.visible) > self.window:
+            evicted.append(self.visible.popleft())
+        if evicted:
+            self._page_out(evicted)
+        return evicted
+
+    def _page_out(self, messages):
+        # Whatever is still on disk is older than the evicted messages, so appending keeps it in order
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile()
+        self._spill.seek(0, 2)
+        for message in messages:
+            self._spill_offsets.append(self._spill.tell())
+            self._spill.write(json.dumps(message).encode("utf-8") + b"\n")
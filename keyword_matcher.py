@@ -0,0 +1,64 @@
+import re
+
+
+# Words, keeping the "#" and "+" of names such as C# and C++
+TOKEN_PATTERN = re.compile(r"\w+[#+]*")
+PARENTHETICAL_PATTERN = re.compile(r"\s*\(.*?\)")
+
+
+def keyword_tokens(text):
+    """Lowercase word tokens of ``text``; underscores separate words, as in knowledge-base keys."""
+    return tuple(TOKEN_PATTERN.findall(text.lower().replace("_", " ")))
+
+
+def normalize_name(name):
+    """Spelling-insensitive form of a topic or subtopic name: "Data_Types" and "data types" agree."""
+    return " ".join(keyword_tokens(name))
+
+
+def strip_parenthetical(name):
+    """Drop explanatory asides: "lists (List<T>)" becomes "lists"."""
+    return PARENTHETICAL_PATTERN.sub("", name).strip()
+
+
+class KeywordMatcher:
+    """
+    Token-level inverted index over keyword phrases.
+
+    Each phrase is filed under its first token together with the
+    ``(kind, value)`` entries it stands for.  ``match`` walks the message once,
+    taking the longest phrase that starts at each token, so its cost depends on
+    the length of the message rather than on how many phrases are indexed.
+    """
+
+    def __init__(self):
+        self._phrases = {}
+
+    def add(self, phrase, kind, value):
+        tokens = keyword_tokens(phrase)
+        if not tokens:
+            return
+        candidates = self._phrases.setdefault(tokens[0], [])
+        for candidate, entries in candidates:
+            if candidate == tokens:
+                if (kind, value) not in entries:
+                    entries.append((kind, value))
+                return
+        candidates.append((tokens, [(kind, value)]))
+        candidates.sort(key=lambda candidate: len(candidate[0]), reverse=True)
+
+    def match(self, text):
+        """Return ``{kind: [values]}`` for the phrases found in ``text``, in message order."""
+        tokens = keyword_tokens(text)
+        matches = {}
+        position = 0
+        while position < len(tokens):
+            for phrase, entries in self._phrases.get(tokens[position], ()):
+                if tokens[position:position + len(phrase)] == phrase:
+                    for kind, value in entries:
+                        matches.setdefault(kind, []).append(value)
+                    position += len(phrase)
+                    break
+            else:
+                position += 1
+        return matches
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+KNOWLEDGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "knowledge")
+
+_shared_resources = {}
+# Guards the two dicts; each resource is built under its own lock
+_shared_lock = threading.Lock()
+_resource_locks = {}
+
+
+def knowledge_path(name):
+    return os.path.join(KNOWLEDGE_DIR, f"{name}.jsonl")
+
+
+def shared_resource(key, factory):
+    """
+    Build ``factory()`` once per process and hand the same object to every caller.
+
+    Only callers asking for the same ``key`` wait while it is built, so a
+    slow index build for one language does not hold up the others.
+    """
+    with _shared_lock:
+        if key in _shared_resources:
+            return _shared_resources[key]
+        lock = _resource_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        with _shared_lock:
+            if key in _shared_resources:
+                return _shared_resources[key]
+        resource = factory()
+        with _shared_lock:
+            _shared_resources[key] = resource
+            _resource_locks.pop(key, None)
+        return resource
+
+
+def read_only(content):
+    """Freeze a ``{name: [entries]}`` dict so it can be shared between agent instances."""
+    return MappingProxyType({key: tuple(values) for key, values in content.items()})
+
+
+class KnowledgeBase(Mapping):
+    """
+    Read-only knowledge base stored as JSON Lines, one topic per line.
+
+    Each line looks like ``{"topic": "basics", "items": [...]}`` where
+    ``items`` keeps the original list-of-dicts layout.  Opening the file only
+    records the byte offset of every topic; a topic's content is parsed the
+    first time it is looked up, so memory holds just the topics in use.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offsets = {}
+        self._topics = {}
+
+        with open(path, "rb") as f:
+            data = f.read()
+        self.fingerprint = hashlib.sha1(data).hexdigest()
+
+        decoder = json.JSONDecoder()
+        offset = 0
+        for line in data.splitlines(keepends=True):
+            if line.strip():
+                text = line.decode("utf-8")
+                # Only decode the topic name; the rest of the line is parsed on demand
+                start = text.index('"topic"') + len('"topic"')
+                start = text.index(":", start) + 1
+                while text[start].isspace():
+                    start += 1
+                topic, _ = decoder.raw_decode(text, start)
+                self._offsets[topic] = offset
+            offset += len(line)
+
+    def __getitem__(self, topic):
+        if topic not in self._topics:
+            offset = self._offsets[topic]
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                record = json.loads(f.readline())
+            self._topics[topic] = record["items"]
+        return self._topics[topic]
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __contains__(self, topic):
+        return topic in self._offsets
+
+    def loaded_topics(self):
+        return list(self._topics)
+
+    def scan(self):
+        """Yield ``(topic, items)`` for every topic without caching them."""
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield record["topic"], record["items"]
+
+
+def write_knowledge_base(path, knowledge_base):
+    """Write a ``{topic: items}`` dict in the format read by ``KnowledgeBase``."""
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        for topic, items in knowledge_base.items():
+            f.write(json.dumps({"topic": topic, "items": items}, ensure_ascii=False))
+            f.write("\n")
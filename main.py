@@ -2,14 +2,28 @@
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+import getpass
 import json
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from agent_registry import create_agent, prefetch_agent
+from chat_transcript import ChatTranscript, DEFAULT_WINDOW
+
+RESPONSE_POLL_MS = 50
+# Messages brought back from the transcript each time the user scrolls to the top
+SCROLLBACK_PAGE = 50
+THINKING_MESSAGE = "Agent: thinking…\n\n"
+# Delay between the chunks of a long answer
+STREAM_CHUNK_MS = 40
+
 
-from csharp_tutorial import CsharpTutorialAgent
-from python_tutorial import PythonTutorialAgent
-from cpp_tutorial import CppTutorialAgent
 class TutorialGUI:
-    def __init__(self, master):
+    def __init__(self, master, prefetch=True, transcript_window=DEFAULT_WINDOW, learner=None):
         self.master = master
+        self.prefetch = prefetch
+        # Progress is saved under this name between runs
+        self.learner = learner or local_learner()
         self.master.title("Programming Tutorial Agent")
         self.master.geometry("700x500")
         self.current_agent = None
@@ -17,9 +31,29 @@ class TutorialGUI:
         self.current_question = 0
         self.quiz_questions = []
 
+        # Agent calls run on a single worker thread so retrieval never freezes the window;
+        # results come back through a queue that the Tk loop polls with master.after
+        self.agent_executor = ThreadPoolExecutor(max_workers=1)
+        self.agent_results = queue.Queue()
+        self.pending_agent_calls = 0
+        self.agent_generation = 0
+        self.latest_message_id = 0
+
+        # Only the newest messages stay in the chat widget; older ones are paged to disk
+        self.transcript = ChatTranscript(transcript_window)
+        self.loading_older = False
+
+        # Messages are queued and drawn together once per idle cycle, see flush_display
+        self.pending_messages = []
+        self.thinking = False
+        self.display_flush_scheduled = False
+        # Rest of the answer being shown a chunk at a time, see display_agent_response
+        self.streaming = None
+
         self.dark_mode = self.load_dark_mode_setting()
         self.create_widgets()
         self.apply_theme()
+        self.prefetch_selected_agent()
 
     def create_widgets(self):
         self.style = ttk.Style()
@@ -76,6 +110,7 @@ class TutorialGUI:
             self.desc_label.config(text=descriptions[self.language_var.get()])
 
         self.language_var.trace('w', update_description)
+        self.language_var.trace('w', self.prefetch_selected_agent)
 
         # Start button with improved styling
         self.start_button = ttk.Button(
@@ -96,7 +131,7 @@ class TutorialGUI:
         )
         self.chat_display.grid(row=4, column=0, columnspan=6, padx=10, pady=10, sticky="nsew")
         self.chat_display.grid_remove()
-        self.chat_display.config(state=tk.DISABLED)
+        self.chat_display.config(state=tk.DISABLED, yscrollcommand=self.on_chat_scroll)
 
         # Create bottom frame for input and buttons
         self.bottom_frame = ttk.Frame(self.main_frame)
@@ -176,8 +211,9 @@ class TutorialGUI:
         widget.bind('<Leave>', leave)
 
     def back_to_menu(self):
-        # Reset agents
+        # Reset agents and drop any response still on its way from the old one
         self.current_agent = None
+        self.agent_generation += 1
 
         # Show welcome screen elements
         self.welcome_label.grid()
@@ -193,15 +229,38 @@ class TutorialGUI:
         self.chat_display.config(state=tk.NORMAL)
         self.chat_display.delete(1.0, tk.END)
         self.chat_display.config(state=tk.DISABLED)
+        self.transcript.clear()
+        self.pending_messages = []
+        self.thinking = False
+        self.streaming = None
+
+    def prefetch_selected_agent(self, *args):
+        # Import the selected agent's module in the background so Start doesn't wait for it
+        if self.prefetch:
+            prefetch_agent(self.language_var.get())
 
     def start_tutorial(self):
         selected_language = self.language_var.get()
-        if selected_language == "Python":
-            self.current_agent = PythonTutorialAgent()
-        elif selected_language == "C#":
-            self.current_agent = CsharpTutorialAgent()
-        else:  # C++
-            self.current_agent = CppTutorialAgent()
+        learner = self.learner
+
+        def load_agent():
+            # Creating an agent can mean building its retrieval index, so it runs off the Tk thread
+            try:
+                agent = create_agent(selected_language, learner)
+                return agent, agent.start_tutorial()
+            except Exception as e:
+                print(f"Error in starting tutorial: {e}")
+                return None, e
+
+        self.start_button.config(state=tk.DISABLED, text="Loading…")
+        self.submit_agent_call(load_agent, lambda result: self.show_tutorial(selected_language, *result))
+
+    def show_tutorial(self, language, agent, greeting):
+        self.start_button.config(state=tk.NORMAL, text="Start Tutorial")
+        if agent is None:
+            messagebox.showerror("Error", f"Could not start the {language} tutorial: {greeting}")
+            return
+        self.current_agent = agent
 
         # Hide welcome screen elements
         self.welcome_label.grid_remove()
@@ -214,25 +273,171 @@ class TutorialGUI:
         self.action_frame.grid()
 
         # Display initial tutorial message
-        self.display_message(f"Starting {selected_language} Tutorial\n\nAgent: " + self.current_agent.start_tutorial())
+        self.display_message(f"Starting {language} Tutorial\n\nAgent: " + greeting)
 
     def send_message(self, event=None):
         user_message = self.user_input.get()
+        self.finish_stream()
+        # Sending a message brings the user back to the newest messages
+        self.trim_transcript()
         self.display_message("You: " + user_message)
         self.user_input.delete(0, tk.END)
 
-        response = self.current_agent.handle_input(user_message)
-        self.display_message("Agent: " + response)
+        agent = self.current_agent
 
-        if self.current_agent.is_exit_command(user_message):
+        self.latest_message_id += 1
+        self.show_thinking()
+        self.submit_agent_call(lambda: agent.respond_chunks(user_message), self.show_message_response,
+                               message_id=self.latest_message_id)
+
+    def show_message_response(self, result):
+        chunks, is_exit = result
+        self.display_agent_response(chunks)
+
+        if is_exit:
             self.master.after(1000, self.master.quit)
 
+    def submit_agent_call(self, call, on_result, message_id=None):
+        generation = self.agent_generation
+
+        def run():
+            try:
+                result = call()
+            except Exception as e:
+                print(f"Error in agent call: {e}")
+                result = e
+            self.agent_results.put((generation, message_id, on_result, result))
+
+        self.agent_executor.submit(run)
+        self.pending_agent_calls += 1
+        if self.pending_agent_calls == 1:
+            self.master.after(RESPONSE_POLL_MS, self.poll_agent_results)
+
+    def poll_agent_results(self):
+        while True:
+            try:
+                generation, message_id, on_result, result = self.agent_results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending_agent_calls -= 1
+
+            # Skip results from an agent the user has left, and replies the user has already sent past
+            if generation != self.agent_generation:
+                continue
+            if message_id is not None:
+                if message_id != self.latest_message_id:
+                    continue
+                self.clear_thinking()
+
+            if isinstance(result, Exception):
+                self.display_message("Agent: Sorry, something went wrong. Please try again.")
+            else:
+                on_result(result)
+
+        if self.pending_agent_calls:
+            self.master.after(RESPONSE_POLL_MS, self.poll_agent_results)
+
+    def show_thinking(self):
+        self.thinking = True
+        self.schedule_display_flush()
+
+    def clear_thinking(self):
+        self.thinking = False
+        self.schedule_display_flush()
+
+    def display_agent_response(self, response):
+        # Long answers come in chunks: show the first one now and the rest over the next moments
+        self.finish_stream()
+        chunks = iter((response,) if isinstance(response, str) else response)
+        self.display_message("Agent: " + next(chunks, ""))
+        self.streaming = chunks
+        self.master.after(STREAM_CHUNK_MS, self.stream_next_chunk, chunks)
+
+    def stream_next_chunk(self, chunks):
+        if self.streaming is not chunks:
+            return
+        chunk = next(chunks, None)
+        if chunk is None:
+            self.streaming = None
+            return
+        self.display_message(chunk)
+        self.master.after(STREAM_CHUNK_MS, self.stream_next_chunk, chunks)
+
+    def finish_stream(self):
+        # Show whatever is left of the previous answer before anything new
+        if self.streaming is not None:
+            for chunk in self.streaming:
+                self.display_message(chunk)
+            self.streaming = None
+
     def display_message(self, message):
+        self.pending_messages.append(message)
+        self.schedule_display_flush()
+
+    def schedule_display_flush(self):
+        if not self.display_flush_scheduled:
+            self.display_flush_scheduled = True
+            self.master.after_idle(self.flush_display)
+
+    def flush_display(self):
+        """Draw every queued message with one insert, one state toggle and one scroll."""
+        self.display_flush_scheduled = False
+        messages, self.pending_messages = self.pending_messages, []
+        placeholder = self.chat_display.tag_ranges("thinking")
+        if not messages and bool(placeholder) == self.thinking:
+            return
+
+        on_screen = len(self.transcript.visible)
+        evicted = []
+        for message in messages:
+            evicted.extend(self.transcript.append(message))
+        # Messages paged out before they were ever drawn need no widget update
+        dropped = evicted[:on_screen]
+        messages = messages[len(evicted) - len(dropped):]
+
         self.chat_display.config(state=tk.NORMAL)
-        self.chat_display.insert(tk.END, message + "\n\n")
-        self.chat_display.see(tk.END)
+        if placeholder:
+            self.chat_display.delete(placeholder[0], placeholder[-1])
+        if dropped:
+            # Drop the lines of messages that were paged out of the transcript window
+            self.chat_display.delete(1.0, f"{message_lines(dropped) + 1}.0")
+        if messages:
+            self.chat_display.insert(tk.END, "".join(message + "\n\n" for message in messages))
+        if self.thinking:
+            self.chat_display.insert(tk.END, THINKING_MESSAGE, "thinking")
+        if not self.transcript.restored:
+            # Leave the view alone while the user is reading older messages
+            self.chat_display.see(tk.END)
         self.chat_display.config(state=tk.DISABLED)
 
+    def on_chat_scroll(self, first, last):
+        self.chat_display.vbar.set(first, last)
+        if float(first) <= 0.0 and self.transcript.has_older() and not self.loading_older:
+            self.loading_older = True
+            self.master.after_idle(self.load_older_messages)
+        elif float(first) > 0.0 and float(last) >= 1.0 and self.transcript.restored:
+            # Back at the newest messages; the restored pages can go again
+            self.master.after_idle(self.trim_transcript)
+
+    def load_older_messages(self):
+        self.loading_older = False
+        older = self.transcript.load_older(SCROLLBACK_PAGE)
+        if not older:
+            return
+        self.chat_display.config(state=tk.NORMAL)
+        self.chat_display.insert(1.0, "".join(message + "\n\n" for message in older))
+        self.chat_display.config(state=tk.DISABLED)
+        # Keep the message the user was looking at in place
+        self.chat_display.yview(f"{message_lines(older) + 1}.0")
+
+    def trim_transcript(self):
+        trimmed = self.transcript.trim()
+        if trimmed:
+            self.chat_display.config(state=tk.NORMAL)
+            self.chat_display.delete(1.0, f"{message_lines(trimmed) + 1}.0")
+            self.chat_display.config(state=tk.DISABLED)
+        self.chat_display.see(tk.END)
+
     def perform_action(self, action):
         if action == "Main Menu":
             if messagebox.askyesno("Confirm",
@@ -250,16 +455,13 @@ class TutorialGUI:
                 "• Main Menu - Return to language selection"
             )
         elif action == "Topics":
-            self.display_message("Agent: " + self.current_agent.list_topics())
+            self.submit_agent_call(self.current_agent.list_topics, self.display_agent_response)
         elif action == "Next":
-            response = self.current_agent.next_subtopic()
-            self.display_message("Agent: " + response)
+            self.submit_agent_call(self.current_agent.next_subtopic_chunks, self.display_agent_response)
         elif action == "Quiz":
-            response = self.current_agent.start_quiz()
-            self.display_message("Agent: " + response)
+            self.submit_agent_call(self.current_agent.start_quiz, self.display_agent_response)
         elif action == "Progress":
-            progress_report = self.current_agent.show_progress()
-            self.display_message("Agent: " + progress_report)
+            self.submit_agent_call(self.current_agent.show_progress, self.display_agent_response)
 
 
     def toggle_dark_mode(self):
@@ -322,6 +524,18 @@ class TutorialGUI:
         with open("settings.json", "w") as f:
             json.dump(settings, f)
 
+def local_learner():
+    try:
+        return getpass.getuser()
+    except Exception:
+        return "default"
+
+
+def message_lines(messages):
+    # Each message is displayed followed by a blank line
+    return sum(message.count("\n") + 2 for message in messages)
+
+
 def main():
     root = tk.Tk()
     gui = TutorialGUI(root)
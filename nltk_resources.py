@@ -0,0 +1,191 @@
+import functools
+import re
+import sys
+import threading
+import time
+
+
+# NLTK packages the tutorial agents can use, with the data paths that satisfy them
+RESOURCES = {
+    "punkt": ("tokenizers/punkt_tab/english/",),
+    "stopwords": ("corpora/stopwords",),
+    "wordnet": ("corpora/wordnet",),
+}
+# NLTK releases before 3.8.2 tokenize with the pickled punkt model; later ones only read punkt_tab
+LEGACY_RESOURCES = {
+    "punkt": ("tokenizers/punkt/english.pickle",),
+}
+PUNKT_TAB_VERSION = (3, 8, 2)
+DOWNLOAD_NAMES = {
+    "punkt": ("punkt_tab", "punkt"),
+    "stopwords": ("stopwords",),
+    "wordnet": ("wordnet",),
+}
+
+_FALLBACK_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Distinct tokens whose lemma is remembered; the tutorial vocabulary is far smaller than this
+LEMMA_CACHE_SIZE = 50000
+
+
+class NltkResources:
+    """
+    Lazy, offline-safe access to the NLTK data used by the tutorial agents.
+
+    The local NLTK data path is searched once per resource, corpora are only
+    loaded the first time they are needed, and the network is never touched
+    unless ``download`` is called explicitly.  When a resource is missing a
+    plain fallback is used instead: a regex tokenizer, scikit-learn's English
+    stopword list and no lemmatization.
+    """
+
+    def __init__(self):
+        self._available = {}
+        self._lookup_time = 0.0
+        self._load_times = {}
+        self._tokenize = None
+        self._stop_words = None
+        self._lemmatize = None
+        # NLTK's lazy corpus loaders are not thread-safe, so resources are loaded one at a time
+        self._load_lock = threading.Lock()
+        self._cached_lemmatize = functools.lru_cache(maxsize=LEMMA_CACHE_SIZE)(self._lemmatize_word)
+
+    def is_available(self, name):
+        if name not in self._available:
+            start = time.perf_counter()
+            self._available[name] = self._find(name)
+            self._lookup_time += time.perf_counter() - start
+        return self._available[name]
+
+    @staticmethod
+    def _find(name):
+        import nltk
+
+        paths = RESOURCES[name]
+        version = tuple(int(part) for part in re.findall(r"\d+", nltk.__version__)[:3])
+        if version < PUNKT_TAB_VERSION:
+            paths = LEGACY_RESOURCES.get(name, paths)
+        for path in paths:
+            try:
+                nltk.data.find(path)
+                return True
+            except LookupError:
+                continue
+        return False
+
+    def signature(self):
+        """Describe which resources are present, since that changes preprocessing output."""
+        return tuple(sorted((name, self.is_available(name)) for name in RESOURCES))
+
+    def download(self, names=None, quiet=True):
+        """
+        Fetch missing resources from the network. This is the only method that does so.
+
+        The running process keeps preprocessing with what it found at start,
+        so cached messages and fitted indexes stay consistent; restart it to
+        use the new data.  Returns which resources are now installed.
+        """
+        import nltk
+
+        for name in names or RESOURCES:
+            if self.is_available(name):
+                continue
+            for package in DOWNLOAD_NAMES[name]:
+                if nltk.download(package, quiet=quiet):
+                    break
+        return {name: self._find(name) for name in names or RESOURCES}
+
+    def _timed(self, name, loader):
+        self.is_available(name)
+        start = time.perf_counter()
+        result = loader()
+        self._load_times[name] = time.perf_counter() - start
+        return result
+
+    def _load_tokenizer(self):
+        if self.is_available("punkt"):
+            from nltk import word_tokenize
+
+            try:
+                word_tokenize("warm up")
+                return word_tokenize
+            except (LookupError, OSError) as e:
+                # Tokenizer data this NLTK release cannot read
+                print(f"Error in loading the NLTK tokenizer, using the fallback: {e}")
+        return _FALLBACK_TOKEN_PATTERN.findall
+
+    def _load_stop_words(self):
+        if self.is_available("stopwords"):
+            from nltk.corpus import stopwords
+
+            return frozenset(stopwords.words("english"))
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+        return frozenset(ENGLISH_STOP_WORDS)
+
+    def _load_lemmatizer(self):
+        if self.is_available("wordnet"):
+            from nltk import WordNetLemmatizer
+
+            lemmatizer = WordNetLemmatizer()
+            lemmatizer.lemmatize("warm")
+            return lemmatizer.lemmatize
+        return lambda word: word
+
+    def tokenize(self, text):
+        if self._tokenize is None:
+            with self._load_lock:
+                if self._tokenize is None:
+                    self._tokenize = self._timed("punkt", self._load_tokenizer)
+        return self._tokenize(text)
+
+    @property
+    def stop_words(self):
+        if self._stop_words is None:
+            with self._load_lock:
+                if self._stop_words is None:
+                    self._stop_words = self._timed("stopwords", self._load_stop_words)
+        return self._stop_words
+
+    def _lemmatize_word(self, word):
+        if self._lemmatize is None:
+            with self._load_lock:
+                if self._lemmatize is None:
+                    self._lemmatize = self._timed("wordnet", self._load_lemmatizer)
+        return self._lemmatize(word)
+
+    def lemmatize(self, word):
+        return self._cached_lemmatize(word)
+
+    def lemma_cache_info(self):
+        return self._cached_lemmatize.cache_info()
+
+    def report(self):
+        lines = []
+        if self._available:
+            lines.append(f"NLTK data path searched in {self._lookup_time * 1000:.1f} ms")
+        for name in RESOURCES:
+            source = "nltk" if self.is_available(name) else "fallback"
+            if name in self._load_times:
+                lines.append(f"{name}: loaded from {source} in {self._load_times[name] * 1000:.1f} ms")
+            else:
+                lines.append(f"{name}: not loaded yet ({source})")
+        return "\n".join(lines)
+
+
+nltk_resources = NltkResources()
+
+
+if __name__ == "__main__":
+    if "download" in sys.argv[1:]:
+        installed = nltk_resources.download(quiet=False)
+    else:
+        installed = {name: nltk_resources.is_available(name) for name in RESOURCES}
+    for name, available in installed.items():
+        print(f"{name}: {'available' if available else 'missing'}")
+
+    # Load everything once to show what the tutorial will use and what it costs
+    nltk_resources.tokenize("warm up")
+    nltk_resources.stop_words
+    nltk_resources.lemmatize("warm")
+    print(nltk_resources.report())
@@ -0,0 +1,66 @@
+import os
+import sqlite3
+import threading
+import time
+
+from knowledge_store import shared_resource
+
+
+PROGRESS_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "progress.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS completed_subtopics (
+    learner TEXT NOT NULL,
+    language TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    subtopic TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    PRIMARY KEY (learner, language, topic, subtopic)
+) WITHOUT ROWID
+"""
+
+
+class ProgressStore:
+    """
+    Completed subtopics of every learner, kept in SQLite.
+
+    Each completed subtopic is one row keyed by learner and language, so
+    recording progress is a single small insert rather than a rewrite of the
+    learner's whole record.  The database runs in WAL mode: a write only
+    appends to the log, and the GUI and server threads can read while another
+    thread writes.
+    """
+
+    def __init__(self, path=PROGRESS_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        # Autocommit; each statement is its own transaction
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # Durable enough for progress and avoids an fsync per completed subtopic
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(SCHEMA)
+
+    def completed(self, learner, language):
+        """Return the ``(topic, subtopic)`` pairs ``learner`` has completed in ``language``."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT topic, subtopic FROM completed_subtopics WHERE learner = ? AND language = ?",
+                (learner, language)).fetchall()
+        return set(rows)
+
+    def record(self, learner, language, topic, subtopic):
+        """Mark one subtopic as completed; recording it again keeps the first completion time."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO completed_subtopics VALUES (?, ?, ?, ?, ?)",
+                (learner, language, topic, subtopic, time.time()))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+def progress_store(path=PROGRESS_DB_PATH):
+    """The process-wide ``ProgressStore`` for ``path``, opened on first use."""
+    return shared_resource(("progress_store", path), lambda: ProgressStore(path))
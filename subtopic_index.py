@@ -0,0 +1,127 @@
+import sys
+
+from keyword_matcher import normalize_name, strip_parenthetical
+
+
+def subtopic_keys(item):
+    """Keys of a knowledge-base item that name subtopics; a list after a subtopic holds its examples."""
+    keys = []
+    for key, content in item.items():
+        if not (isinstance(content, list) and keys):
+            keys.append(key)
+    return keys
+
+
+class CanonicalNames:
+    """
+    One interned ID for every spelling of a topic or subtopic name.
+
+    Outline display names ("data types"), knowledge-base keys ("data_types")
+    and aliases ("ORM" for "ORM_SQLAlchemy") are registered when the tutorial
+    loads, so resolving any of them is a single dict probe.  ``aliases`` maps
+    a canonical name to the other names it goes by.  Unregistered spellings
+    fall back to ``normalize_name``.
+    """
+
+    def __init__(self, aliases=None):
+        self._ids = {}
+        for canonical, names in (aliases or {}).items():
+            canonical_id = self.register(canonical)
+            for name in names:
+                self.register(name, canonical_id)
+
+    def register(self, name, canonical_id=None):
+        """Record ``name`` (under ``canonical_id`` if given) and return its ID."""
+        normalized = normalize_name(name)
+        if canonical_id is None:
+            canonical_id = self._ids.get(normalized) or sys.intern(normalized)
+        self._ids[name] = canonical_id
+        self._ids[normalized] = canonical_id
+        return canonical_id
+
+    def resolve(self, name):
+        canonical_id = self._ids.get(name)
+        if canonical_id is None:
+            normalized = normalize_name(name)
+            canonical_id = self._ids.get(normalized, normalized)
+        return canonical_id
+
+
+class SubtopicIndex:
+    """
+    Constant-time lookups between a tutorial's outline and its knowledge base.
+
+    Built once per language from one pass over the knowledge base.  Every
+    name is resolved to a canonical ID, and a ``(topic, subtopic)`` ID pair
+    maps to where the subtopic's record lives (knowledge-base topic, item
+    position, key), so reading it only loads that topic.  Every outline entry
+    is also mapped to its position so the tutorial can step forwards and
+    backwards without searching the outline, and every record back to the
+    outline name learners see.
+    """
+
+    def __init__(self, topics, knowledge_base, aliases=None):
+        self.topics = topics
+        self.knowledge_base = knowledge_base
+        self.names = CanonicalNames(aliases)
+        self.positions = {}
+        self.records = {}
+        self.records_by_subtopic = {}
+        self.display_names = {}
+
+        for kb_topic, items in knowledge_base.scan():
+            topic_id = self.names.register(kb_topic)
+            for item_position, item in enumerate(items):
+                for key in subtopic_keys(item):
+                    subtopic_id = self.names.register(key)
+                    location = (kb_topic, item_position, key)
+                    self.records.setdefault((topic_id, subtopic_id), location)
+                    self.records_by_subtopic.setdefault(subtopic_id, location)
+
+        for topic, subtopics in topics.items():
+            self.names.register(topic)
+            for position, subtopic in enumerate(subtopics):
+                self.positions[(topic, subtopic)] = position
+                if self.names.register(subtopic) not in self.records_by_subtopic:
+                    # "map, filter, reduce (functional-style operations in C++)" is stored without the aside
+                    stripped_id = self.names.resolve(strip_parenthetical(subtopic))
+                    if stripped_id in self.records_by_subtopic:
+                        self.names.register(subtopic, stripped_id)
+                location = self.locate(subtopic, topic)
+                if location is not None:
+                    self.display_names.setdefault(location, (topic, subtopic))
+
+    def same_topic(self, first, second):
+        return self.names.resolve(first) == self.names.resolve(second)
+
+    def locate(self, subtopic, topic=None):
+        """Return the ``(kb_topic, item_position, key)`` of a subtopic, preferring ``topic``; ``None`` if unknown."""
+        subtopic_id = self.names.resolve(subtopic)
+        location = None
+        if topic is not None:
+            location = self.records.get((self.names.resolve(topic), subtopic_id))
+        return location or self.records_by_subtopic.get(subtopic_id)
+
+    def outline_entry(self, subtopic, topic=None):
+        """The outline ``(topic, subtopic)`` names of a subtopic given by any spelling, such as knowledge-base keys."""
+        entry = self.display_names.get(self.locate(subtopic, topic))
+        if entry is None:
+            entry = (topic.replace("_", " ") if topic is not None else None, subtopic.replace("_", " "))
+        return entry
+
+    def display_name(self, subtopic, topic=None):
+        """The outline name of a subtopic given by any spelling, such as a knowledge-base key."""
+        return self.outline_entry(subtopic, topic)[1]
+
+    def position(self, topic, subtopic):
+        """Position of ``subtopic`` in the outline of ``topic``, or ``None``."""
+        return self.positions.get((topic, subtopic))
+
+    def neighbour(self, topic, subtopic, step):
+        """The subtopic ``step`` places after ``subtopic`` in ``topic``'s outline, or ``None`` past either end."""
+        position = self.position(topic, subtopic)
+        if position is None:
+            return None
+        position += step
+        subtopics = self.topics[topic]
+        return subtopics[position] if 0 <= position < len(subtopics) else None
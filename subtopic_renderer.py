@@ -0,0 +1,124 @@
+import textwrap
+
+from subtopic_index import subtopic_keys
+
+
+# Knowledge-base fields whose text is source code
+CODE_FIELDS = ("example", "examples", "usage_example")
+
+
+class PlainTheme:
+    """Text for the Tk chat window: labelled sections, indented code and bullet points."""
+
+    name = "plain"
+
+    def heading(self, title):
+        return f"{title}:"
+
+    def code(self, source, language):
+        return "\n".join("    " + line if line else "" for line in source.splitlines())
+
+    def bullet(self, text):
+        return f"  • {text}"
+
+
+class MarkdownTheme:
+    """Markdown for web clients of the tutorial server."""
+
+    name = "markdown"
+
+    def heading(self, title):
+        return f"### {title}"
+
+    def code(self, source, language):
+        return f"```{language}\n{source}\n```"
+
+    def bullet(self, text):
+        return f"- {text}"
+
+
+THEMES = {theme.name: theme for theme in (PlainTheme(), MarkdownTheme())}
+
+
+def _source(code):
+    # Snippets are stored as indented triple-quoted strings
+    return textwrap.dedent(code).strip("\n")
+
+
+def _title(key):
+    return key.replace("_", " ").strip().capitalize()
+
+
+class SubtopicRenderer:
+    """
+    Formats knowledge-base records for display and remembers the result.
+
+    A record may be a plain string, or a dict of description, example
+    snippets and lists such as best practices, optionally followed in its
+    item by attached lists (``{"closures": "...", "examples": [...]}``).  Each
+    record is rendered once per theme; later views are a dict lookup.
+    """
+
+    def __init__(self, knowledge_base, code_language):
+        self.knowledge_base = knowledge_base
+        self.code_language = code_language
+        self._chunks = {}
+
+    def render_chunks(self, location, theme="plain"):
+        """
+        Return the record at ``location`` (from ``SubtopicIndex.locate``) as a
+        tuple of chunks that can be shown one at a time: the description, each
+        example, then each list such as best practices.  Joined with blank
+        lines they form the whole text.
+        """
+        key = (location, theme)
+        chunks = self._chunks.get(key)
+        if chunks is None:
+            chunks = self._chunks[key] = self._render(location, THEMES[theme])
+        return chunks
+
+    def _render(self, location, theme):
+        kb_topic, item_position, subtopic = location
+        item = self.knowledge_base[kb_topic][item_position]
+        chunks = self._field_chunks(theme, "description", item[subtopic])
+
+        # Lists that follow the subtopic in its item belong to it
+        keys = list(item)
+        later_subtopics = set(subtopic_keys(item))
+        for field in keys[keys.index(subtopic) + 1:]:
+            if field in later_subtopics:
+                break
+            chunks.extend(self._field_chunks(theme, field, item[field], heading=True))
+        return tuple(chunks)
+
+    def _field_chunks(self, theme, field, value, heading=False):
+        if isinstance(value, dict):
+            chunks = []
+            for name, content in value.items():
+                if field in CODE_FIELDS and isinstance(content, str):
+                    chunks.append(f"{theme.heading(_title(name))}\n\n{theme.code(_source(content), self.code_language)}")
+                elif name == "description" and isinstance(content, str):
+                    chunks.append(content)
+                else:
+                    chunks.extend(self._field_chunks(theme, name, content, heading=True))
+            if field != "description" and chunks:
+                # The section heading travels with its first entry
+                chunks[0] = f"{theme.heading(_title(field))}\n\n{chunks[0]}"
+            return chunks
+
+        if isinstance(value, list):
+            lines = [line for line in value if isinstance(line, str)]
+            if field in CODE_FIELDS:
+                body = theme.code("\n".join(lines), self.code_language)
+            elif any(line.startswith(("#", "- ")) for line in lines):
+                # Notes that already carry their own headings and bullets
+                body = "\n".join(lines).strip()
+            else:
+                body = "\n".join(theme.bullet(line) for line in lines)
+        elif field in CODE_FIELDS:
+            body = theme.code(_source(str(value)), self.code_language)
+        elif heading and field != "description":
+            return [f"{theme.heading(_title(field))} {value}"]
+        else:
+            return [str(value)]
+        return [f"{theme.heading(_title(field))}\n\n{body}" if heading else body]
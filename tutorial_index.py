@@ -0,0 +1,380 @@
+import hashlib
+import os
+import pickle
+
+import numpy as np
+import scipy.sparse as sp
+import sklearn
+from sklearn.cluster import KMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+
+# Relative weight of each knowledge-base field when scoring a passage
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "description": 2.0,
+    "best_practices": 1.5,
+    "concepts": 1.5,
+    "examples": 1.0,
+    "example": 1.0,
+}
+DEFAULT_FIELD_WEIGHT = 1.0
+
+# Bumped when the pickled layout of the indexes changes, so stored indexes are rebuilt
+INDEX_FORMAT = 2
+
+# Size of the LSA embedding used by SemanticIndex
+SEMANTIC_DIMENSIONS = 128
+# Small knowledge bases get at most one LSA dimension per this many passages, so the
+# embedding still merges related terms instead of reproducing the TF-IDF space
+PASSAGES_PER_DIMENSION = 2
+
+# Similarity of the best match below which the agent asks what the learner meant instead of
+# answering, calibrated per index on on-topic questions and small talk from all three tutorials
+TFIDF_MIN_SIMILARITY = 0.45
+SEMANTIC_MIN_SIMILARITY = 0.4
+# Inverted lists of the semantic index searched for each query
+SEMANTIC_PROBES = 4
+
+
+def index_path_for(module_file, kind="index"):
+    """Return the on-disk location of an index that belongs to an agent module."""
+    return os.path.splitext(os.path.abspath(module_file))[0] + f".{kind}.pkl"
+
+
+def _load_state(path, fingerprint):
+    try:
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        return None
+
+    if not isinstance(state, dict) or state.get("fingerprint") != fingerprint:
+        return None
+    return state
+
+
+def _save_state(path, state):
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"Could not save retrieval index to {path}: {e}")
+
+
+def _field_passages(field, value):
+    if isinstance(value, str):
+        yield field, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if field is None:
+                yield from _field_passages(key, item)
+            elif isinstance(item, str):
+                # Snippet names such as "basic_variables" carry useful vocabulary too
+                yield field, f"{key.replace('_', ' ')}\n{item}"
+            else:
+                yield from _field_passages(field, item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _field_passages(field, item)
+
+
+def knowledge_base_passages(topics):
+    """
+    Split ``(topic, items)`` pairs from a knowledge base into weighted passages.
+
+    Yields ``((topic, subtopic), text, weight)`` for the subtopic name and for
+    every description, example snippet and best practice under it, in
+    knowledge-base order so that passages of one subtopic are contiguous.
+    Some entries keep their examples in a list next to the subtopic key
+    (``{"closures": "...", "examples": [...]}``); those lists are attached to
+    the subtopic that precedes them.
+    """
+    for topic, items in topics:
+        for item in items:
+            label = None
+            for key, content in item.items():
+                if isinstance(content, list) and label is not None:
+                    for _, text in _field_passages(key, content):
+                        yield label, text, FIELD_WEIGHTS.get(key, DEFAULT_FIELD_WEIGHT)
+                    continue
+
+                label = (topic, key)
+                yield label, key.replace("_", " "), FIELD_WEIGHTS["name"]
+                for field, text in _field_passages(None if isinstance(content, dict) else "description", content):
+                    yield label, text, FIELD_WEIGHTS.get(field, DEFAULT_FIELD_WEIGHT)
+
+
+def corpus_fingerprint(*parts):
+    """Hash everything that determines the fitted index: the source data and how it is preprocessed."""
+    digest = hashlib.sha1(sklearn.__version__.encode("utf-8"))
+    digest.update(repr((INDEX_FORMAT, sorted(FIELD_WEIGHTS.items()))).encode("utf-8"))
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def prose_passages(weights):
+    """
+    Which passages count towards a match's similarity: names, descriptions and
+    best practices, but not code snippets.  Snippets are often a single line,
+    so one shared identifier ("hello", "today") would give them a
+    near-perfect cosine.  ``weights`` are the field weights the index was
+    built with.
+    """
+    return np.asarray(weights) > DEFAULT_FIELD_WEIGHT
+
+
+class RetrievalIndex:
+    """
+    Ranking shared by the retrieval indexes; subclasses provide ``labels``,
+    ``scores``, ``batch_scores``, ``scores_and_similarities`` and
+    ``min_similarity``, the similarity below which a match is too weak to act on.
+
+    Labels are ranked by field-weighted scores, which have no fixed upper
+    bound.  How confident a match is comes from its similarity: the plain
+    cosine, between 0 and 1, of the label's closest prose passage.
+    """
+
+    def best_match(self, preprocessed_query):
+        return self.labels[self.scores(preprocessed_query).argmax()]
+
+    def top_k(self, preprocessed_queries, k=1):
+        """Return ``(indices, scores)`` arrays of the ``k`` best labels per query, best first."""
+        return self._rank(self.batch_scores(preprocessed_queries), k)
+
+    @staticmethod
+    def _rank(scores, k):
+        k = min(k, scores.shape[1])
+        # Partition out the k best labels, then sort only those
+        indices = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k < scores.shape[1] else \
+            np.broadcast_to(np.arange(k), scores.shape)
+        top_scores = np.take_along_axis(scores, indices, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        return np.take_along_axis(indices, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+    def best_matches(self, preprocessed_query, k=1):
+        """Return up to ``k`` ``(label, similarity)`` pairs for one query, ranked by score, best first."""
+        scores, similarities = self.scores_and_similarities(preprocessed_query)
+        indices, _ = self._rank(scores[np.newaxis], k)
+        return [(self.labels[index], float(similarities[index])) for index in indices[0]]
+
+
+class TfidfIndex(RetrievalIndex):
+    """
+    TF-IDF retrieval index that is fitted once per knowledge base.
+
+    Every passage is a row of one sparse matrix, scaled by its field weight.
+    A query is scored against all passages with a single sparse product and
+    each label keeps the score of its best passage.  The fitted index is
+    pickled next to the agent module and reloaded on startup as long as the
+    corpus fingerprint matches.
+    """
+
+    min_similarity = TFIDF_MIN_SIMILARITY
+
+    def __init__(self, labels, group_starts, vectorizer, matrix, weights, fingerprint):
+        self.labels = labels
+        self.group_starts = group_starts
+        self.vectorizer = vectorizer
+        self.matrix = matrix
+        self.weights = weights
+        self.fingerprint = fingerprint
+        # Undoes the field weight of prose passages and ignores the rest
+        self.similarity_scale = np.where(prose_passages(weights), 1.0 / weights, 0.0)
+
+    @classmethod
+    def build(cls, passages, fingerprint):
+        labels = []
+        group_starts = []
+        documents = []
+        weights = []
+        for row, (label, document, weight) in enumerate(passages):
+            if not labels or labels[-1] != label:
+                labels.append(label)
+                group_starts.append(row)
+            documents.append(document)
+            weights.append(weight)
+
+        vectorizer = TfidfVectorizer()
+        matrix = vectorizer.fit_transform(documents)
+        weights = np.asarray(weights, dtype=np.float64)
+        matrix = (sp.diags(weights) @ matrix).tocsr()
+        return cls(labels, np.asarray(group_starts, dtype=np.intp), vectorizer, matrix, weights, fingerprint)
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        state = _load_state(path, fingerprint)
+        if state is None:
+            return None
+        return cls(state["labels"], state["group_starts"], state["vectorizer"], state["matrix"], state["weights"],
+                   fingerprint)
+
+    @classmethod
+    def load_or_build(cls, path, fingerprint, passages, preprocess):
+        # ``passages`` is only consumed when the stored index is missing or stale
+        index = cls.load(path, fingerprint)
+        if index is None:
+            index = cls.build(((label, preprocess(text), weight) for label, text, weight in passages), fingerprint)
+            index.save(path)
+        return index
+
+    def save(self, path):
+        _save_state(path, {
+            "labels": self.labels,
+            "group_starts": self.group_starts,
+            "vectorizer": self.vectorizer,
+            "matrix": self.matrix,
+            "weights": self.weights,
+            "fingerprint": self.fingerprint,
+        })
+
+    def scores(self, preprocessed_query):
+        # Rows are L2-normalised before weighting, so this is a weighted cosine similarity
+        query_vector = self.vectorizer.transform([preprocessed_query])
+        passage_scores = (self.matrix @ query_vector.T).toarray().ravel()
+        return np.maximum.reduceat(passage_scores, self.group_starts)
+
+    def scores_and_similarities(self, preprocessed_query):
+        """Weighted score and unweighted cosine similarity of every label for one query."""
+        query_vector = self.vectorizer.transform([preprocessed_query])
+        passage_scores = (self.matrix @ query_vector.T).toarray().ravel()
+        return (np.maximum.reduceat(passage_scores, self.group_starts),
+                np.maximum.reduceat(passage_scores * self.similarity_scale, self.group_starts))
+
+    def batch_scores(self, preprocessed_queries):
+        """Scores of every label for each query, as a ``(queries, labels)`` array from one sparse product."""
+        query_matrix = self.vectorizer.transform(preprocessed_queries)
+        passage_scores = (query_matrix @ self.matrix.T).toarray()
+        return np.maximum.reduceat(passage_scores, self.group_starts, axis=1)
+
+
+class SemanticIndex(RetrievalIndex):
+    """
+    Dense LSA retrieval index built on top of a ``TfidfIndex``.
+
+    Passages are projected with ``TruncatedSVD`` into a small float32
+    embedding, so questions can match passages that share related rather than
+    identical words.  The embeddings are grouped into k-means clusters and a
+    query is only compared with the passages of its ``SEMANTIC_PROBES``
+    closest clusters (an inverted-file approximate nearest-neighbour search).
+    Scores are cosine similarities scaled by the same field weights as the
+    TF-IDF index.  Dense cosines run much higher than sparse ones, so a
+    match's similarity is scaled by how much of the query the embedding
+    represents: a query whose words are rare in the corpus barely projects
+    and cannot produce a confident match.
+    """
+
+    min_similarity = SEMANTIC_MIN_SIMILARITY
+
+    def __init__(self, labels, vectorizer, projection, centroids, list_starts, vectors, weights, passage_labels,
+                 fingerprint, probes=SEMANTIC_PROBES):
+        self.labels = labels
+        self.vectorizer = vectorizer
+        self.projection = projection
+        self.centroids = centroids
+        self.list_starts = list_starts
+        self.vectors = vectors
+        self.weights = weights
+        self.prose = prose_passages(weights)
+        self.passage_labels = passage_labels
+        self.fingerprint = fingerprint
+        self.probes = probes
+
+    @classmethod
+    def build(cls, tfidf_index, fingerprint, dimensions=SEMANTIC_DIMENSIONS):
+        matrix = tfidf_index.matrix
+        # Field weights are small binary fractions, so float32 keeps them exact
+        weights = tfidf_index.weights.astype(np.float32)
+        passage_labels = np.repeat(np.arange(len(tfidf_index.labels)),
+                                   np.diff(np.append(tfidf_index.group_starts, matrix.shape[0])))
+
+        dimensions = max(2, min(dimensions, matrix.shape[0] // PASSAGES_PER_DIMENSION, matrix.shape[1] - 1))
+        svd = TruncatedSVD(n_components=dimensions, random_state=0)
+        vectors = normalize(svd.fit_transform(matrix)).astype(np.float32)
+
+        n_lists = max(1, int(np.sqrt(len(vectors))))
+        clusters = KMeans(n_clusters=n_lists, n_init=1, random_state=0).fit(vectors)
+        # Store passages cluster by cluster so each inverted list is one contiguous slice
+        order = np.argsort(clusters.labels_, kind="stable")
+        list_starts = np.searchsorted(clusters.labels_[order], np.arange(n_lists + 1))
+        centroids = normalize(clusters.cluster_centers_).astype(np.float32)
+
+        # Kept as a plain matrix: a sparse-dense product is much cheaper than TruncatedSVD.transform per query
+        projection = np.ascontiguousarray(svd.components_.T)
+        return cls(tfidf_index.labels, tfidf_index.vectorizer, projection, centroids, list_starts,
+                   vectors[order], weights[order], passage_labels[order], fingerprint)
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        state = _load_state(path, fingerprint)
+        if state is None:
+            return None
+        return cls(state["labels"], state["vectorizer"], state["projection"], state["centroids"], state["list_starts"],
+                   state["vectors"], state["weights"], state["passage_labels"], fingerprint)
+
+    @classmethod
+    def load_or_build(cls, path, fingerprint, tfidf_index):
+        index = cls.load(path, fingerprint)
+        if index is None:
+            index = cls.build(tfidf_index, fingerprint)
+            index.save(path)
+        return index
+
+    def save(self, path):
+        _save_state(path, {
+            "labels": self.labels,
+            "vectorizer": self.vectorizer,
+            "projection": self.projection,
+            "centroids": self.centroids,
+            "list_starts": self.list_starts,
+            "vectors": self.vectors,
+            "weights": self.weights,
+            "passage_labels": self.passage_labels,
+            "fingerprint": self.fingerprint,
+        })
+
+    def _project(self, preprocessed_queries):
+        return np.asarray(self.vectorizer.transform(preprocessed_queries) @ self.projection, dtype=np.float32)
+
+    def embed(self, preprocessed_queries):
+        vectors = self._project(preprocessed_queries)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1)
+
+    def _label_scores(self, query_vector, with_similarities=False):
+        probes = min(self.probes, len(self.centroids))
+        nearest = np.argpartition(-(self.centroids @ query_vector), probes - 1)[:probes]
+        candidates = np.concatenate([np.arange(self.list_starts[i], self.list_starts[i + 1]) for i in nearest])
+        similarities = self.vectors[candidates] @ query_vector
+        labels = self.passage_labels[candidates]
+
+        # Labels without a probed passage keep a score of zero
+        scores = np.zeros(len(self.labels), dtype=np.float32)
+        np.maximum.at(scores, labels, similarities * self.weights[candidates])
+        if not with_similarities:
+            return scores
+        label_similarities = np.zeros(len(self.labels), dtype=np.float32)
+        np.maximum.at(label_similarities, labels, similarities * self.prose[candidates])
+        return scores, label_similarities
+
+    def batch_scores(self, preprocessed_queries):
+        """Scores of every label for each query, as a ``(queries, labels)`` array."""
+        return np.vstack([self._label_scores(vector) for vector in self.embed(preprocessed_queries)])
+
+    def scores(self, preprocessed_query):
+        return self.batch_scores([preprocessed_query])[0]
+
+    def scores_and_similarities(self, preprocessed_query):
+        """Weighted score and similarity of every label for one query."""
+        vector = self._project([preprocessed_query])[0]
+        # TF-IDF queries are unit length, so this is the share of the query the embedding keeps
+        kept = float(np.linalg.norm(vector))
+        if kept == 0:
+            return np.zeros(len(self.labels), dtype=np.float32), np.zeros(len(self.labels), dtype=np.float32)
+        scores, similarities = self._label_scores(vector / kept, with_similarities=True)
+        return scores, similarities * kept
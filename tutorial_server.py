@@ -0,0 +1,339 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+from agent_registry import available_languages
+from base_tutorial import RETRIEVAL_MODES, BaseTutorialAgent
+from subtopic_renderer import THEMES
+from tutorial_sessions import SESSION_ACTIONS, SessionManager
+from unified_search import DEFAULT_HITS, unified_search
+
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_BODY_SIZE = 64 * 1024
+EXPIRY_INTERVAL = 60
+
+# Operations exposed over HTTP (POST /<action>) and WebSocket ({"action": ...})
+ACTIONS = ("start_tutorial", "handle_input", "search") + SESSION_ACTIONS
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class TutorialServer:
+    """
+    Asyncio HTTP and WebSocket front end for the tutorial agents.
+
+    HTTP clients ``POST /<action>`` a JSON body and pass the ``session_id``
+    returned by ``start_tutorial`` on later calls.  A WebSocket connection to
+    ``/ws`` owns one session and sends ``{"action": ..., ...}`` messages.
+    Agent calls run on a thread pool so retrieval never blocks the event loop.
+    """
+
+    def __init__(self, manager=None, max_workers=None):
+        self.manager = manager or SessionManager()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tutorial-agent")
+
+    async def dispatch(self, action, payload, session_id=None):
+        if action not in ACTIONS:
+            raise RequestError(HTTPStatus.NOT_FOUND, f"Unknown action {action!r}")
+
+        loop = asyncio.get_running_loop()
+        if action == "start_tutorial":
+            language = payload.get("language", "Python")
+            if language not in available_languages():
+                raise RequestError(HTTPStatus.BAD_REQUEST, f"Unknown language {language!r}")
+            learner = payload.get("learner")
+            if learner is not None and not isinstance(learner, str):
+                raise RequestError(HTTPStatus.BAD_REQUEST, "'learner' must be a string")
+            session, greeting = await loop.run_in_executor(self.executor, self.manager.start_session, language,
+                                                           None, learner)
+            return {"session_id": session.session_id, "response": greeting}
+        if action == "search":
+            # Searches every tutorial at once and needs no session
+            return await loop.run_in_executor(self.executor, self.search, payload)
+
+        session_id = session_id or payload.get("session_id")
+        if session_id is not None and not isinstance(session_id, str):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'session_id' must be a string")
+        if session_id not in self.manager:
+            raise RequestError(HTTPStatus.NOT_FOUND, "Unknown or expired session; call start_tutorial first")
+
+        try:
+            if action == "handle_input":
+                message = payload.get("message")
+                if not isinstance(message, str):
+                    raise RequestError(HTTPStatus.BAD_REQUEST, "handle_input needs a 'message' string")
+                if payload.get("stream"):
+                    chunks = await loop.run_in_executor(self.executor, self.manager.stream_input, session_id, message)
+                    return {"session_id": session_id, "chunks": chunks, "active": session_id in self.manager}
+                response = await loop.run_in_executor(self.executor, self.manager.handle_input, session_id, message)
+            else:
+                response = await loop.run_in_executor(self.executor, self.manager.perform, session_id, action)
+        except KeyError:
+            raise RequestError(HTTPStatus.NOT_FOUND, "Unknown or expired session; call start_tutorial first") from None
+        return {"session_id": session_id, "response": response, "active": session_id in self.manager}
+
+    @staticmethod
+    def search(payload):
+        query = payload.get("query")
+        languages = payload.get("languages")
+        k = payload.get("k", DEFAULT_HITS)
+        if not isinstance(query, str):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "search needs a 'query' string")
+        if languages is not None and not (isinstance(languages, list)
+                                          and all(isinstance(language, str) for language in languages)):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'languages' must be a list of strings")
+        if not isinstance(k, int) or isinstance(k, bool):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "'k' must be an integer")
+        try:
+            hits = unified_search().search(query, k, languages)
+        except (TypeError, ValueError) as e:
+            raise RequestError(HTTPStatus.BAD_REQUEST, str(e)) from None
+        return {"results": [{"language": language, "topic": topic, "subtopic": subtopic, "score": score}
+                            for language, topic, subtopic, score in hits]}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+
+                if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                    await self.serve_websocket(reader, writer, headers)
+                    break
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, result = await self.handle_http(method, path, body)
+                if "chunks" in result:
+                    await self.write_stream_response(writer, result, keep_alive)
+                else:
+                    await self.write_response(writer, status, result, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader):
+        try:
+            request_line = await reader.readline()
+        except ConnectionError:
+            return None
+        if not request_line.strip():
+            return None
+
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        length = int(headers.get("content-length", 0) or 0)
+        if length > MAX_BODY_SIZE:
+            raise ConnectionError("Request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), path.split("?", 1)[0], headers, body
+
+    async def handle_http(self, method, path, body):
+        try:
+            if method == "GET" and path in ("/", "/languages"):
+                return HTTPStatus.OK, {"languages": available_languages(), "actions": list(ACTIONS)}
+            if method != "POST":
+                raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST /<action> with a JSON body")
+            return HTTPStatus.OK, await self.dispatch(path.strip("/"), self.parse_json(body))
+        except RequestError as e:
+            return e.status, {"error": str(e)}
+        except Exception as e:
+            print(f"Error in handling {method} {path}: {e}")
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+
+    @staticmethod
+    def parse_json(data):
+        if not data:
+            return {}
+        try:
+            payload = json.loads(data)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Body must be JSON") from None
+        if not isinstance(payload, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        return payload
+
+    @staticmethod
+    async def write_response(writer, status, result, keep_alive):
+        body = json.dumps(result).encode("utf-8")
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    @staticmethod
+    async def write_stream_response(writer, result, keep_alive):
+        # JSON Lines over chunked transfer encoding, one line per chunk as soon as it is available
+        writer.write(("HTTP/1.1 200 OK\r\n"
+                      "Content-Type: application/x-ndjson; charset=utf-8\r\n"
+                      "Transfer-Encoding: chunked\r\n"
+                      f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode("latin-1"))
+        for message in stream_messages(result):
+            line = json.dumps(message).encode("utf-8") + b"\n"
+            writer.write(f"{len(line):x}\r\n".encode("latin-1") + line + b"\r\n")
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def serve_websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode("latin-1")).digest()).decode("ascii")
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\n"
+                      "Upgrade: websocket\r\n"
+                      "Connection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+        session_id = None
+        try:
+            while True:
+                message = await read_websocket_message(reader, writer)
+                if message is None:
+                    break
+                try:
+                    payload = self.parse_json(message)
+                    if payload.get("session_id", session_id) != session_id:
+                        raise RequestError(HTTPStatus.FORBIDDEN, "A WebSocket connection can only use its own session")
+                    if payload.get("action") == "start_tutorial" and session_id is not None:
+                        self.manager.end_session(session_id)
+                        session_id = None
+                    result = await self.dispatch(payload.get("action"), payload, session_id)
+                    # Session-less actions such as search leave the connection's session alone
+                    if "session_id" in result:
+                        session_id = result["session_id"] if result.get("active", True) else None
+                except RequestError as e:
+                    result = {"error": str(e)}
+                except Exception as e:
+                    print(f"Error in handling WebSocket message: {e}")
+                    result = {"error": "Internal server error"}
+
+                # One frame per chunk, so the client can show the start of a long answer right away
+                for frame in stream_messages(result):
+                    await write_websocket_frame(writer, 0x1, json.dumps(frame).encode("utf-8"))
+        finally:
+            # The session belongs to this connection only
+            if session_id is not None:
+                self.manager.end_session(session_id)
+
+    async def expire_sessions(self):
+        while True:
+            await asyncio.sleep(EXPIRY_INTERVAL)
+            self.manager.expire_idle_sessions()
+
+    async def serve(self, host="127.0.0.1", port=8765):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        expiry = asyncio.create_task(self.expire_sessions())
+        print(f"Tutorial server listening on http://{host}:{port} (WebSocket at /ws)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            expiry.cancel()
+            self.executor.shutdown(wait=False)
+
+
+def stream_messages(result):
+    """
+    Split a result into the messages sent to the client: a ``{"chunk": ...}``
+    message per chunk of a streamed answer, then the rest of the result with
+    ``"done": true``.  Other results are sent as they are.
+    """
+    if "chunks" not in result:
+        yield result
+        return
+    result = dict(result)
+    for chunk in result.pop("chunks"):
+        yield {"chunk": chunk}
+    result["done"] = True
+    yield result
+
+
+async def read_websocket_message(reader, writer):
+    """Return the next text or binary message, answering pings; ``None`` once the peer closes."""
+    fragments = []
+    while True:
+        first, second = await reader.readexactly(2)
+        fin, opcode = first & 0x80, first & 0x0F
+        length = second & 0x7F
+        if length == 126:
+            length, = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:
+            length, = struct.unpack("!Q", await reader.readexactly(8))
+        if length > MAX_BODY_SIZE:
+            await write_websocket_frame(writer, 0x8, struct.pack("!H", 1009))
+            return None
+
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        payload = await reader.readexactly(length)
+        if mask:
+            payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+
+        if opcode == 0x8:
+            await write_websocket_frame(writer, 0x8, payload[:2])
+            return None
+        if opcode == 0x9:
+            await write_websocket_frame(writer, 0xA, payload)
+            continue
+        if opcode == 0xA:
+            continue
+
+        fragments.append(payload)
+        if fin:
+            return b"".join(fragments)
+
+
+async def write_websocket_frame(writer, opcode, payload):
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    writer.write(header + payload)
+    await writer.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the tutorial agents over HTTP and WebSocket.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="threads used for agent calls")
+    parser.add_argument("--retrieval", choices=RETRIEVAL_MODES, default=BaseTutorialAgent.retrieval_mode,
+                        help="how free-text questions are matched to subtopics")
+    parser.add_argument("--theme", choices=THEMES, default="markdown", help="formatting of tutorial content")
+    args = parser.parse_args()
+    BaseTutorialAgent.retrieval_mode = args.retrieval
+    BaseTutorialAgent.render_theme = args.theme
+
+    try:
+        asyncio.run(TutorialServer(max_workers=args.workers).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from agent_registry import available_languages, create_agent
+
+
+# Agent methods a front end may call on a session besides handle_input
+SESSION_ACTIONS = ("list_topics", "next_subtopic", "start_quiz", "show_progress")
+
+
+class TutorialSession:
+    """
+    One learner's conversation with a tutorial agent.
+
+    The agent only holds per-learner state (current topic, mode, progress);
+    the knowledge base and retrieval index behind it are shared process-wide.
+    """
+
+    __slots__ = ("session_id", "language", "agent", "last_active", "lock")
+
+    def __init__(self, session_id, language, agent):
+        self.session_id = session_id
+        self.language = language
+        self.agent = agent
+        self.last_active = time.monotonic()
+        self.lock = threading.Lock()
+
+    def respond(self, message):
+        """Return the agent's ``(response, is_exit)`` for ``message``."""
+        with self.lock:
+            self.last_active = time.monotonic()
+            return self.agent.respond(message)
+
+    def respond_chunks(self, message):
+        with self.lock:
+            self.last_active = time.monotonic()
+            return self.agent.respond_chunks(message)
+
+    def handle_input(self, message):
+        return self.respond(message)[0]
+
+    def perform(self, action):
+        if action not in SESSION_ACTIONS:
+            raise ValueError(f"Unknown session action {action!r}")
+        with self.lock:
+            self.last_active = time.monotonic()
+            return getattr(self.agent, action)()
+
+
+class SessionManager:
+    """
+    UI-free front end for the tutorial agents.
+
+    Sessions are keyed by id and kept in least-recently-used order; once
+    ``max_sessions`` is reached the idlest session is dropped, and sessions
+    idle for longer than ``idle_timeout`` seconds are removed by
+    ``expire_idle_sessions``.  All methods are safe to call from many threads.
+    """
+
+    def __init__(self, max_sessions=10000, idle_timeout=30 * 60):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self._sessions
+
+    def start_session(self, language, session_id=None, learner=None):
+        """
+        Create a session and return it together with the agent's greeting.
+        Progress is saved under ``learner`` if one is given.
+        """
+        agent = create_agent(language, learner)
+        session = TutorialSession(session_id or uuid.uuid4().hex, language, agent)
+        with self._lock:
+            self._sessions[session.session_id] = session
+            self._sessions.move_to_end(session.session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session, agent.greet()
+
+    def get_session(self, session_id):
+        with self._lock:
+            try:
+                session = self._sessions[session_id]
+            except KeyError:
+                raise KeyError(f"Unknown session {session_id!r}") from None
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def end_session(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def handle_input(self, session_id, message):
+        session = self.get_session(session_id)
+        response, is_exit = session.respond(message)
+        if is_exit:
+            self.end_session(session_id)
+        return response
+
+    def stream_input(self, session_id, message):
+        """Like ``handle_input``, but return the response as an iterator of chunks to send one by one."""
+        session = self.get_session(session_id)
+        chunks, is_exit = session.respond_chunks(message)
+        if is_exit:
+            self.end_session(session_id)
+        return chunks
+
+    def perform(self, session_id, action):
+        return self.get_session(session_id).perform(action)
+
+    def expire_idle_sessions(self, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = [session_id for session_id, session in self._sessions.items()
+                       if now - session.last_active > self.idle_timeout]
+            for session_id in expired:
+                del self._sessions[session_id]
+        return len(expired)
+
+
+def main():
+    language = sys.argv[1] if len(sys.argv) > 1 else "Python"
+    if language not in available_languages():
+        print(f"Choose one of: {', '.join(available_languages())}")
+        return
+
+    manager = SessionManager()
+    session, greeting = manager.start_session(language)
+    print(f"Agent: {greeting}")
+    for line in sys.stdin:
+        print(f"Agent: {manager.handle_input(session.session_id, line)}")
+        if session.session_id not in manager:
+            break
+
+
+if __name__ == "__main__":
+    main()
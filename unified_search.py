@@ -0,0 +1,109 @@
+import argparse
+
+import numpy as np
+
+from agent_registry import available_languages, get_agent_class
+from base_tutorial import preprocess_passage, preprocess_text
+from knowledge_store import shared_resource
+from nltk_resources import nltk_resources
+from tutorial_index import TfidfIndex, corpus_fingerprint, index_path_for, knowledge_base_passages
+
+
+UNIFIED_INDEX_PATH = index_path_for(__file__)
+DEFAULT_HITS = 5
+
+
+class UnifiedSearch:
+    """
+    One TF-IDF index over the knowledge bases of every tutorial.
+
+    Labels are ``(language, topic, subtopic)`` and each language's labels are
+    contiguous, so a language filter is a set of slices over one score
+    vector.  A single vectorizer and matrix serve all languages; the
+    per-language knowledge bases are only streamed while the index is built.
+    Index labels hold knowledge-base keys; hits are reported under the
+    tutorial outline's names, as the tutorials themselves show them.
+    """
+
+    def __init__(self, index, language_slices, outline_labels):
+        self.index = index
+        self.language_slices = language_slices
+        # (language, outline topic, outline subtopic) for each index label
+        self.outline_labels = outline_labels
+
+    @classmethod
+    def load(cls, path=UNIFIED_INDEX_PATH, languages=None):
+        languages = languages or available_languages()
+        contents = {language: get_agent_class(language).content for language in languages}
+        knowledge_bases = [(language, contents[language].shared_knowledge_base()) for language in languages]
+        fingerprint = corpus_fingerprint(
+            [(language, kb.fingerprint) for language, kb in knowledge_bases], nltk_resources.signature())
+
+        def passages():
+            for language, kb in knowledge_bases:
+                for label, text, weight in knowledge_base_passages(kb.scan()):
+                    yield (language,) + label, text, weight
+
+        index = TfidfIndex.load_or_build(path, fingerprint, passages(), preprocess_passage)
+        language_slices = {}
+        for position, (language, _, _) in enumerate(index.labels):
+            start, _ = language_slices.get(language, (position, position))
+            language_slices[language] = (start, position + 1)
+
+        subtopic_indexes = {language: content.shared_subtopic_index() for language, content in contents.items()}
+        outline_labels = [(language,) + subtopic_indexes[language].outline_entry(subtopic, topic)
+                          for language, topic, subtopic in index.labels]
+        return cls(index, language_slices, outline_labels)
+
+    def search(self, query, k=DEFAULT_HITS, languages=None):
+        """
+        Return up to ``k`` ``(language, topic, subtopic, score)`` hits for
+        ``query``, best first, optionally only from ``languages``.
+
+        Topics and subtopics are outline names; knowledge-base entries that
+        share one outline subtopic are reported once, at their best score.
+        """
+        scores = self.index.scores(preprocess_text(query))
+        if languages is not None:
+            allowed = np.zeros(len(scores), dtype=bool)
+            for language in languages:
+                if language not in self.language_slices:
+                    raise ValueError(f"No tutorial content indexed for {language!r}")
+                allowed[slice(*self.language_slices[language])] = True
+            scores = np.where(allowed, scores, 0.0)
+
+        hits = []
+        seen = set()
+        if k <= 0:
+            return hits
+        # A zero score shares no terms with the query (or was filtered out)
+        matching = np.flatnonzero(scores > 0)
+        for i in matching[np.argsort(-scores[matching], kind="stable")]:
+            label = self.outline_labels[i]
+            if label not in seen:
+                seen.add(label)
+                hits.append(label + (float(scores[i]),))
+                if len(hits) == k:
+                    break
+        return hits
+
+
+def unified_search():
+    """The process-wide ``UnifiedSearch``, built on first use."""
+    return shared_resource(("unified_index", UNIFIED_INDEX_PATH), UnifiedSearch.load)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search every tutorial's knowledge base at once.")
+    parser.add_argument("query")
+    parser.add_argument("--language", action="append", choices=available_languages(),
+                        help="only search this language (repeatable)")
+    parser.add_argument("-k", type=int, default=DEFAULT_HITS, help="number of hits")
+    args = parser.parse_args()
+
+    for language, topic, subtopic, score in unified_search().search(args.query, args.k, args.language):
+        print(f"{score:.3f}  [{language}] {topic} / {subtopic}")
+
+
+if __name__ == "__main__":
+    main()